@@ -10,28 +10,75 @@ This module is responsible for rendering:
 
 from __future__ import annotations
 
+import functools
 from typing import Any, Dict, Optional
 
 import discord
 
 from .scmm_client import (
+    MAP_TYPES,
     StoreItem,
     extract_market_urls,
     get_market_breakdown,
 )
 
+# ======================================================================
+# Shared string constants / footer templates
+# ======================================================================
+
+#: Price block shown when no detail JSON is available at all.
+_NO_PRICE_DATA = "**Store:** Unknown\n**Steam Market:** No data"
+
+#: Footer templates. The ones without a leading underscore are shared
+#: with command handlers in `bot.main`.
+FOOTER_WEEK_STORE = "SCMM • Store {date}{sid} • Auto-deletes in 5 minutes"
+FOOTER_WEEK_BY_DATE = "SCMM • Weekly Store by Date • Auto-deletes in 5 minutes"
+FOOTER_ITEM_OVERVIEW = "SCMM • Item Market Overview • Auto-deletes in 5 minutes"
+
+_FOOTER_WEEKLY_CARD = "SCMM • Weekly Rust Store • Auto-deletes in 5 minutes"
+_FOOTER_LOOKUP = "SCMM • Lookup • Auto-deletes in 5 minutes"
+
+
 # ======================================================================
 # Price / market text rendering
 # ======================================================================
 
 
+def _fmt_pct_line(
+    label: str,
+    price: float,
+    pct: Optional[float],
+    vs_label: str,
+) -> str:
+    """
+    Format a single market price line, e.g.
+
+        **Steam Market:** $1.23 (🟢 +4.5% vs store)
+
+    Omits the parenthesised delta when no percentage is available.
+    """
+    if pct is None:
+        return f"**{label}:** ${price:.2f}"
+
+    if pct >= 0:
+        sign, emoji, pct_abs = "+", "🟢", pct
+    else:
+        sign, emoji, pct_abs = "-", "🔴", -pct
+
+    return f"**{label}:** ${price:.2f} ({emoji} {sign}{pct_abs:.1f}% vs {vs_label})"
+
+
 def _render_market_lines(
-    details: Optional[Dict[str, Any]],
+    bd: Optional[Dict[str, Optional[float]]],
     include_third_party: bool,
 ) -> str:
     """
     Build the price block text based on the unified market breakdown.
 
+    Takes a pre-extracted breakdown dict (see `get_market_breakdown`) so
+    callers that need the breakdown elsewhere only walk the details JSON
+    once.
+
     Always shows:
     - Store price (USD)
     - Steam vs Store
@@ -40,18 +87,13 @@ def _render_market_lines(
     - Skinport vs Steam
     - CS.Deals vs Steam
     """
-    if not details:
-        return "**Store:** Unknown\n**Steam Market:** No data"
+    if not bd:
+        return _NO_PRICE_DATA
 
-    bd = get_market_breakdown(details)
-
-    store = bd["store_price"]
-    steam = bd["steam_price"]
-    steam_pct = bd["steam_vs_store_pct"]
-    skinport = bd["skinport_price"]
-    skinport_pct = bd["skinport_vs_steam_pct"]
-    csdeals = bd["csdeals_price"]
-    csdeals_pct = bd["csdeals_vs_steam_pct"]
+    bd_get = bd.get
+    store = bd_get("store_price")
+    steam = bd_get("steam_price")
+    steam_pct = bd_get("steam_vs_store_pct")
 
     lines: list[str] = []
 
@@ -63,43 +105,25 @@ def _render_market_lines(
 
     # Steam vs Store
     if steam is not None:
-        if steam_pct is not None:
-            sign = "+" if steam_pct >= 0 else "-"
-            emoji = "🟢" if steam_pct >= 0 else "🔴"
-            lines.append(
-                f"**Steam Market:** ${steam:.2f} "
-                f"({emoji} {sign}{abs(steam_pct):.1f}% vs store)"
-            )
-        else:
-            lines.append(f"**Steam Market:** ${steam:.2f}")
+        lines.append(_fmt_pct_line("Steam Market", steam, steam_pct, "store"))
     else:
         lines.append("**Steam Market:** No data")
 
-    # Skinport / CS.Deals vs Steam
+    # Skinport / CS.Deals vs Steam — only read these keys when they will
+    # actually be rendered (the weekly path passes False for 20 items).
     if include_third_party:
+        skinport = bd_get("skinport_price")
+        skinport_pct = bd_get("skinport_vs_steam_pct")
+        csdeals = bd_get("csdeals_price")
+        csdeals_pct = bd_get("csdeals_vs_steam_pct")
+
         if skinport is not None:
-            if skinport_pct is not None:
-                sign = "+" if skinport_pct >= 0 else "-"
-                emoji = "🟢" if skinport_pct >= 0 else "🔴"
-                lines.append(
-                    f"**Skinport:** ${skinport:.2f} "
-                    f"({emoji} {sign}{abs(skinport_pct):.1f}% vs Steam)"
-                )
-            else:
-                lines.append(f"**Skinport:** ${skinport:.2f}")
+            lines.append(_fmt_pct_line("Skinport", skinport, skinport_pct, "Steam"))
         else:
             lines.append("**Skinport:** No listings")
 
         if csdeals is not None:
-            if csdeals_pct is not None:
-                sign = "+" if csdeals_pct >= 0 else "-"
-                emoji = "🟢" if csdeals_pct >= 0 else "🔴"
-                lines.append(
-                    f"**CS.Deals:** ${csdeals:.2f} "
-                    f"({emoji} {sign}{abs(csdeals_pct):.1f}% vs Steam)"
-                )
-            else:
-                lines.append(f"**CS.Deals:** ${csdeals:.2f}")
+            lines.append(_fmt_pct_line("CS.Deals", csdeals, csdeals_pct, "Steam"))
         else:
             lines.append("**CS.Deals:** No listings")
 
@@ -111,7 +135,11 @@ def _render_market_lines(
 # ======================================================================
 
 
-def build_iteminfo_view(details: Dict[str, Any]) -> Optional[discord.ui.View]:
+def build_iteminfo_view(
+    details: Dict[str, Any],
+    *,
+    urls: Optional[Dict[str, Optional[str]]] = None,
+) -> Optional[discord.ui.View]:
     """
     Build a link-button row for `/item_lookup`:
 
@@ -119,12 +147,21 @@ def build_iteminfo_view(details: Dict[str, Any]) -> Optional[discord.ui.View]:
     - 🟣 CS.Deals
     - 🟢 Skinport
 
+    Parameters
+    ----------
+    details:
+        SCMM item detail JSON.
+    urls:
+        Pre-extracted marketplace URLs; pass these when the caller has
+        already run `extract_market_urls` to avoid a second traversal.
+
     Returns
     -------
     discord.ui.View | None
         View containing link buttons, or None if no URLs are available.
     """
-    urls = extract_market_urls(details)
+    if urls is None:
+        urls = extract_market_urls(details)
 
     view = discord.ui.View()
     buttons = 0
@@ -177,6 +214,42 @@ def build_iteminfo_view(details: Dict[str, Any]) -> Optional[discord.ui.View]:
 # ======================================================================
 
 
+#: Fallback key chains used against SCMM detail JSON, hoisted so the
+#: tuples are built once instead of per call.
+_ICON_KEYS = ("iconUrl", "iconURL", "imageUrl")
+_SUPPLY_KEYS = ("supplyTotalEstimated", "supplyTotalOwnersEstimated")
+_SUBS_KEYS = ("subscriptionsCurrent", "subscriptionsLifetime")
+_FAVS_KEYS = ("favouritedCurrent", "favouritedLifetime")
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_int(n: int) -> str:
+    """Thousands-separated int formatting, memoized.
+
+    Supply/subscriber counts repeat heavily across items in the same
+    store, so the separator formatting usually becomes a cache hit.
+    """
+    return f"{n:,}"
+
+
+def _first(get: Any, keys: tuple[str, ...]) -> Any:
+    """
+    Evaluate `get(a) or get(b) or ...` over `keys`, short-circuiting.
+
+    Driven by `next` over a generator so the scan terminates in C on the
+    first truthy hit rather than through a Python-level loop per key.
+    Like an or-chain, falls back to the LAST key's value when every
+    result is falsy — a trailing numeric 0 (e.g. zero supply on a fresh
+    item) must surface as 0, not disappear as None.
+    """
+    return next((v for k in keys if (v := get(k))), get(keys[-1]))
+
+
+def _pick_icon(details: Dict[str, Any]) -> Optional[str]:
+    """Return the item icon URL from the usual SCMM fallback keys."""
+    return _first(details.get, _ICON_KEYS)
+
+
 def _build_stats_block(details: Optional[Dict[str, Any]]) -> Optional[str]:
     """
     Build the multi-line insider stats block from item details JSON.
@@ -189,20 +262,26 @@ def _build_stats_block(details: Optional[Dict[str, Any]]) -> Optional[str]:
     - Favourites
     - Views
     - Breaks-into components (if present)
+
+    This runs once per item on the weekly path, so the bound `get` /
+    `append` locals and the `_first` fallback helper keep the dict and
+    attribute lookups to one apiece.
     """
     if not details:
         return None
 
+    get = details.get
     lines: list[str] = []
+    append = lines.append
+
+    def _num(val: Any) -> Optional[float]:
+        return float(val) if isinstance(val, (int, float)) else None
 
     # Released date + store price
-    released = details.get("timeAccepted")
-    store_price = details.get("storePrice")
-    if isinstance(store_price, (int, float)):
-        store_price = float(store_price)
-        store_price = store_price / 100.0 if store_price > 50 else store_price
-    else:
-        store_price = None
+    released = get("timeAccepted")
+    store_price = _num(get("storePrice"))
+    if store_price is not None and store_price > 50:
+        store_price = store_price / 100.0
 
     date_txt = None
     if isinstance(released, str) and released:
@@ -211,107 +290,94 @@ def _build_stats_block(details: Optional[Dict[str, Any]]) -> Optional[str]:
     if date_txt or store_price is not None:
         price_part = f"for **${store_price:.2f}**" if store_price is not None else ""
         if date_txt:
-            lines.append(f"🛒 Released on **{date_txt}** {price_part}".strip())
+            append(f"🛒 Released on **{date_txt}** {price_part}".strip())
         elif price_part:
-            lines.append(f"🛒 Store price {price_part}")
+            append(f"🛒 Store price {price_part}")
 
     # Supply
-    supply_est = (
-        details.get("supplyTotalEstimated")
-        or details.get("supplyTotalOwnersEstimated")
-    )
-    if isinstance(supply_est, (int, float)):
-        lines.append(f"📦 Estimated supply: **{int(supply_est):,}**")
+    supply_est = _num(_first(get, _SUPPLY_KEYS))
+    if supply_est is not None:
+        append(f"📦 Estimated supply: **{_fmt_int(int(supply_est))}**")
 
     # Subscribers
-    subs = details.get("subscriptionsCurrent") or details.get("subscriptionsLifetime")
-    if isinstance(subs, (int, float)):
-        lines.append(f"👥 Workshop subscribers: **{int(subs):,}**")
+    subs = _num(_first(get, _SUBS_KEYS))
+    if subs is not None:
+        append(f"👥 Workshop subscribers: **{_fmt_int(int(subs))}**")
 
     # Votes + rating
-    votes_up = details.get("votesUp")
-    votes_down = details.get("votesDown")
+    votes_up = get("votesUp")
+    votes_down = get("votesDown")
     if isinstance(votes_up, int) and isinstance(votes_down, int):
         total_votes = votes_up + votes_down
         if total_votes > 0:
             ratio = (votes_up / total_votes) * 100.0
-            lines.append(f"👍 Votes: **{total_votes:,}** ({ratio:.0f}% positive)")
+            append(f"👍 Votes: **{_fmt_int(total_votes)}** ({ratio:.0f}% positive)")
 
     # Favourites
-    favs = details.get("favouritedCurrent") or details.get("favouritedLifetime")
-    if isinstance(favs, (int, float)):
-        lines.append(f"⭐ Favourited: **{int(favs):,}**")
+    favs = _num(_first(get, _FAVS_KEYS))
+    if favs is not None:
+        append(f"⭐ Favourited: **{_fmt_int(int(favs))}**")
 
     # Views
-    views = details.get("views")
-    if isinstance(views, (int, float)):
-        lines.append(f"👀 Workshop views: **{int(views):,}**")
-
-    # Breaks into components
-    components = details.get("breaksIntoComponents")
-    if isinstance(components, dict) and components:
+    views = _num(get("views"))
+    if views is not None:
+        append(f"👀 Workshop views: **{_fmt_int(int(views))}**")
+
+    # Breaks into components. MAP_TYPES rather than dict: detail
+    # payloads on the weekly path may be lazy simdjson proxies.
+    components = get("breaksIntoComponents")
+    if isinstance(components, MAP_TYPES) and components:
         parts = [
             f"{int(v)}x {k}"
             for k, v in components.items()
             if isinstance(v, (int, float))
         ]
         if parts:
-            lines.append("🪓 Breaks into " + ", ".join(parts))
+            append("🪓 Breaks into " + ", ".join(parts))
 
     return "\n".join(lines) if lines else None
 
 
 # ======================================================================
-# Weekly store embed
+# Embed builders
 # ======================================================================
 
 
-def build_store_item_embed(
-    item: StoreItem,
-    details: Optional[Dict[str, Any]] = None,
+def _build_embed(
     *,
-    include_third_party: bool = True,
+    title: str,
+    description: str,
+    color: discord.Color,
+    icon_url: Optional[str],
+    details: Optional[Dict[str, Any]],
+    include_third_party: bool,
+    footer: str,
+    id_lines: Optional[list[str]] = None,
+    breakdown: Optional[Dict[str, Optional[float]]] = None,
 ) -> discord.Embed:
     """
-    Weekly-style card with pricing + stats.
+    Shared card assembly for all item embeds.
 
-    For `/week_lookup` you typically pass `include_third_party=False`
-    so it shows only Store vs Steam. For other contexts, you can enable
-    full Store / Steam / Skinport / CS.Deals breakdown.
+    Runs the common sequence once — title/description, large image,
+    price block, optional IDs field, stats block, footer — so the public
+    builders below stay thin wrappers over one hot code path.
     """
-    subtitle_parts: list[str] = []
-    if item.item_type:
-        subtitle_parts.append(item.item_type)
-    if item.collection:
-        subtitle_parts.append(f"{item.collection} collection")
-    subtitle = " • ".join(subtitle_parts) if subtitle_parts else "Rust store item"
+    embed = discord.Embed(title=title, description=description, color=color)
 
-    embed = discord.Embed(
-        title=item.name,
-        description=subtitle,
-        color=discord.Color.dark_orange(),
-    )
-
-    if item.icon_url:
-        embed.set_image(url=item.icon_url)
+    # Only the large image: a thumbnail with the same URL just bloats the
+    # embed JSON without changing what Discord renders.
+    if icon_url:
+        embed.set_image(url=icon_url)
 
-    # Prices: Store vs Steam vs 3rd party
-    price_block = _render_market_lines(details, include_third_party=include_third_party)
+    bd = breakdown
+    if bd is None and details:
+        bd = get_market_breakdown(details)
     embed.add_field(
         name="🛒 Prices",
-        value=price_block,
+        value=_render_market_lines(bd, include_third_party=include_third_party),
         inline=False,
     )
 
-    # IDs / meta
-    id_lines: list[str] = []
-    if item.workshop_file_id:
-        id_lines.append(f"Workshop: `{item.workshop_file_id}`")
-    if item.id is not None:
-        id_lines.append(f"Store ID: `{item.id}`")
-    if item.app_id:
-        id_lines.append(f"App ID: `{item.app_id}`")
-
     if id_lines:
         embed.add_field(
             name="🧾 Details",
@@ -327,13 +393,49 @@ def build_store_item_embed(
             inline=False,
         )
 
-    embed.set_footer(text="SCMM • Weekly Rust Store • Auto-deletes in 5 minutes")
+    embed.set_footer(text=footer)
     return embed
 
 
-# ======================================================================
-# Optional single-item lookup embed (Store vs Steam only)
-# ======================================================================
+def build_store_item_embed(
+    item: StoreItem,
+    details: Optional[Dict[str, Any]] = None,
+    *,
+    include_third_party: bool = True,
+) -> discord.Embed:
+    """
+    Weekly-style card with pricing + stats.
+
+    For `/week_lookup` you typically pass `include_third_party=False`
+    so it shows only Store vs Steam. For other contexts, you can enable
+    full Store / Steam / Skinport / CS.Deals breakdown.
+    """
+    subtitle_parts: list[str] = []
+    if item.item_type:
+        subtitle_parts.append(item.item_type)
+    if item.collection:
+        subtitle_parts.append(f"{item.collection} collection")
+    subtitle = " • ".join(subtitle_parts) if subtitle_parts else "Rust store item"
+
+    # IDs / meta
+    id_lines: list[str] = []
+    if item.workshop_file_id:
+        id_lines.append(f"Workshop: `{item.workshop_file_id}`")
+    if item.id is not None:
+        id_lines.append(f"Store ID: `{item.id}`")
+    if item.app_id:
+        id_lines.append(f"App ID: `{item.app_id}`")
+
+    return _build_embed(
+        title=item.name,
+        description=subtitle,
+        color=discord.Color.dark_orange(),
+        icon_url=item.icon_url,
+        details=details,
+        include_third_party=include_third_party,
+        footer=_FOOTER_WEEKLY_CARD,
+        id_lines=id_lines,
+    )
 
 
 def build_lookup_embed(details: Dict[str, Any]) -> discord.Embed:
@@ -343,49 +445,22 @@ def build_lookup_embed(details: Dict[str, Any]) -> discord.Embed:
     Not currently used by `/week_lookup` or `/item_lookup`, but kept as a
     generic helper for “just check store vs Steam for this one item”.
     """
-    name = details.get("name") or "Unknown item"
-
-    icon_url = (
-        details.get("iconUrl")
-        or details.get("iconURL")
-        or details.get("imageUrl")
-    )
-
-    embed = discord.Embed(
-        title=name,
+    return _build_embed(
+        title=details.get("name") or "Unknown item",
         description="Lookup: Store vs Steam Market",
         color=discord.Color.blurple(),
+        icon_url=_pick_icon(details),
+        details=details,
+        include_third_party=False,
+        footer=_FOOTER_LOOKUP,
     )
 
-    if icon_url:
-        embed.set_thumbnail(url=icon_url)
-        embed.set_image(url=icon_url)
 
-    price_block = _render_market_lines(details, include_third_party=False)
-    embed.add_field(
-        name="🛒 Prices",
-        value=price_block,
-        inline=False,
-    )
-
-    stats_block = _build_stats_block(details)
-    if stats_block:
-        embed.add_field(
-            name="📊 Item stats",
-            value=stats_block,
-            inline=False,
-        )
-
-    embed.set_footer(text="SCMM • Lookup • Auto-deletes in 5 minutes")
-    return embed
-
-
-# ======================================================================
-# /item_lookup overview embed
-# ======================================================================
-
-
-def build_item_overview_embed(details: Dict[str, Any]) -> discord.Embed:
+def build_item_overview_embed(
+    details: Dict[str, Any],
+    *,
+    breakdown: Optional[Dict[str, Optional[float]]] = None,
+) -> discord.Embed:
     """
     Full market overview card for a single Rust skin.
 
@@ -395,46 +470,25 @@ def build_item_overview_embed(details: Dict[str, Any]) -> discord.Embed:
     - Skinport / CS.Deals (vs Steam)
     - Insider stats (subs, views, votes, favourites, etc.)
 
-    This is what `/item_lookup` uses.
+    This is what `/item_lookup` uses. Pass `breakdown` when the caller
+    already has it from `extract_market_info` to skip the price walk.
     """
-    name = details.get("name") or "Unknown item"
-
-    icon_url = (
-        details.get("iconUrl")
-        or details.get("iconURL")
-        or details.get("imageUrl")
-    )
-
-    embed = discord.Embed(
-        title=name,
+    return _build_embed(
+        title=details.get("name") or "Unknown item",
         description="Cross-market overview (Store, Steam, Skinport, CS.Deals)",
         color=discord.Color.blurple(),
+        icon_url=_pick_icon(details),
+        details=details,
+        include_third_party=True,
+        footer=FOOTER_ITEM_OVERVIEW,
+        breakdown=breakdown,
     )
 
-    if icon_url:
-        embed.set_image(url=icon_url)
-
-    # Prices: Store vs Steam vs 3rd party (Skinport / CS.Deals)
-    price_block = _render_market_lines(details, include_third_party=True)
-    embed.add_field(
-        name="🛒 Prices",
-        value=price_block,
-        inline=False,
-    )
-
-    stats_block = _build_stats_block(details)
-    if stats_block:
-        embed.add_field(
-            name="📊 Item stats",
-            value=stats_block,
-            inline=False,
-        )
-
-    embed.set_footer(text="SCMM • Item Market Overview • Auto-deletes in 5 minutes")
-    return embed
-
 
 __all__ = [
+    "FOOTER_WEEK_STORE",
+    "FOOTER_WEEK_BY_DATE",
+    "FOOTER_ITEM_OVERVIEW",
     "build_iteminfo_view",
     "build_store_item_embed",
     "build_lookup_embed",
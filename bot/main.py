@@ -15,16 +15,28 @@ Messages sent by bot commands auto-delete after a configurable delay.
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import itertools
 import json
 import logging
+import functools
+import heapq
 import os
+import time
 from datetime import date as Date
+from itertools import islice
+from pathlib import Path
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 from dotenv import load_dotenv
 
+try:  # optional: much faster dumps for large SCMM payloads
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
 from . import embeds, scmm_client
 
 # ======================================================================
@@ -37,9 +49,16 @@ GUILD_ID: int = 1425205255976783956
 #: Maximum number of items to show for a weekly store lookup.
 MAX_WEEK_ITEMS: int = 20
 
+#: Maximum number of concurrent SCMM detail lookups per command.
+MAX_DETAIL_CONCURRENCY: int = 5
+
 #: Default auto-delete delay for command responses (seconds).
 DEFAULT_DELETE_DELAY: int = 300
 
+#: File that remembers the hash of the last-synced command payload, so
+#: unchanged boots can skip the Discord command-sync round-trip.
+COMMAND_HASH_FILE: Path = Path(".command_hash")
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
@@ -77,27 +96,197 @@ class RustSCMMBot(commands.Bot):
             intents=intents,
         )
 
+    def _command_payload_hash(self, guild: discord.Object) -> str | None:
+        """
+        Hash the serialized command tree for `guild`.
+
+        Returns None if the payload cannot be serialized (e.g. after a
+        discord.py upgrade changes internals), in which case callers
+        should fall back to always syncing.
+        """
+        try:
+            payload = [
+                command.to_dict(self.tree)
+                for command in self.tree.get_commands(guild=guild)
+            ]
+            blob = json.dumps(payload, sort_keys=True, default=str).encode()
+            return hashlib.sha256(blob).hexdigest()
+        except Exception:  # noqa: BLE001
+            logger.warning("Could not hash command payload; will sync.", exc_info=True)
+            return None
+
     async def setup_hook(self) -> None:
         """
         Called by discord.py after login.
 
         Here we sync the app commands to the configured guild to ensure
         fast propagation and avoid global registration delays.
+
+        Syncing serializes the whole tree and POSTs it to Discord, which
+        costs a rate-limit bucket on every boot even when nothing
+        changed — so we remember a hash of the last-synced payload and
+        skip the sync when it matches.
         """
+        # One long-lived consumer handles every scheduled auto-delete
+        # instead of one sleeping task per sent message.
+        self._autodelete_task = asyncio.create_task(_autodelete_loop())
+
+        # Prime the shared SCMM connection pool (DNS + TLS + HTTP/2
+        # handshake) before the first command needs it. The client
+        # itself is configured and lazily built inside scmm_client.
+        await scmm_client.warmup()
+
         guild = discord.Object(id=GUILD_ID)
 
         # Sync all global commands into the target guild
         self.tree.copy_global_to(guild=guild)
+
+        payload_hash = self._command_payload_hash(guild)
+        if payload_hash is not None:
+            try:
+                if COMMAND_HASH_FILE.read_text().strip() == payload_hash:
+                    logger.info(
+                        "Command payload unchanged (hash %.12s); skipping sync.",
+                        payload_hash,
+                    )
+                    return
+            except OSError:
+                pass  # no hash recorded yet
+
         synced = await self.tree.sync(guild=guild)
         logger.info("Synced %d commands to guild %s", len(synced), GUILD_ID)
 
+        if payload_hash is not None:
+            try:
+                COMMAND_HASH_FILE.write_text(payload_hash)
+            except OSError:
+                logger.warning("Could not persist command hash.", exc_info=True)
+
+
+    async def close(self) -> None:
+        """Release the shared SCMM client before discord.py shuts down."""
+        await scmm_client.aclose_client()
+        await super().close()
+
 
 bot = RustSCMMBot()
 
+# ======================================================================
+# SCMM response caching (bot side)
+# ======================================================================
+
+#: How long cached store-by-date results stay fresh (seconds). Item
+#: detail and store-list responses are cached inside scmm_client; this
+#: layer only keeps the assembled (items, store_id) result per date.
+SCMM_CACHE_TTL: float = 300.0
+
+#: Soft cap on cached entries before the stalest ones are evicted.
+SCMM_CACHE_MAX_ENTRIES: int = 1024
+
+_store_date_cache: dict[str, tuple[float, tuple[list[scmm_client.StoreItem], str | None]]] = {}
+
+
+def _cache_put(cache: dict, key: str, value: object) -> None:
+    """Store `value` under `key`, evicting the oldest entries at the cap."""
+    if len(cache) >= SCMM_CACHE_MAX_ENTRIES:
+        for stale_key, _ in sorted(cache.items(), key=lambda kv: kv[1][0])[
+            : SCMM_CACHE_MAX_ENTRIES // 4
+        ]:
+            del cache[stale_key]
+    cache[key] = (time.monotonic(), value)
+
+
+def _cache_get(cache: dict, key: str) -> object | None:
+    """Return a fresh cached value for `key`, or None on miss/expiry."""
+    hit = cache.get(key)
+    if hit is None:
+        return None
+    ts, value = hit
+    if time.monotonic() - ts >= SCMM_CACHE_TTL:
+        del cache[key]
+        return None
+    return value
+
+
+async def _cached_store_items_for_date(
+    target_date: Date,
+) -> tuple[list[scmm_client.StoreItem], str | None]:
+    """
+    `scmm_client.fetch_store_items_for_date` with the same TTL cache,
+    keyed on the ISO date. Empty results (no store that day) are not
+    cached so a store appearing mid-rotation shows up promptly.
+    """
+    key = target_date.isoformat()
+    cached = _cache_get(_store_date_cache, key)
+    if cached is not None:
+        return cached  # type: ignore[return-value]
+
+    result = await scmm_client.fetch_store_items_for_date(target_date)
+    if result[0]:
+        _cache_put(_store_date_cache, key, result)
+    return result
+
+
 # ======================================================================
 # Utility: send follow-up + auto-delete
 # ======================================================================
 
+#: Channel feeding the deletion consumer with (deadline, tie-breaker,
+#: message) entries. A single consumer task drains it, so a burst of
+#: week_lookup embeds costs one background task instead of one sleeping
+#: task per message. Ordering lives in the consumer's local heap.
+_autodelete_queue: asyncio.Queue[
+    tuple[float, int, discord.Message]
+] = asyncio.Queue()
+
+#: Monotonic tie-breaker so equal deadlines never compare Message objects.
+_autodelete_seq = itertools.count()
+
+
+def schedule_autodelete(message: discord.Message, delay: float) -> None:
+    """Queue `message` for deletion `delay` seconds from now."""
+    deadline = asyncio.get_running_loop().time() + delay
+    _autodelete_queue.put_nowait((deadline, next(_autodelete_seq), message))
+
+
+async def _autodelete_loop() -> None:
+    """
+    Single long-running consumer for scheduled message deletions.
+
+    Delays are caller-chosen, so arrival order need not match deadline
+    order: the loop keeps pending entries in a heap and, while waiting
+    for the earliest deadline, stays parked on the queue so an entry
+    with a shorter delay wakes it up and jumps the line.
+    """
+    log = logging.getLogger(__name__)
+    loop = asyncio.get_running_loop()
+    pending: list[tuple[float, int, discord.Message]] = []
+
+    while True:
+        if not pending:
+            heapq.heappush(pending, await _autodelete_queue.get())
+            continue
+
+        wait = pending[0][0] - loop.time()
+        if wait > 0:
+            try:
+                entry = await asyncio.wait_for(_autodelete_queue.get(), timeout=wait)
+            except asyncio.TimeoutError:
+                continue
+            heapq.heappush(pending, entry)
+            continue
+
+        _, _, message = heapq.heappop(pending)
+        try:
+            await message.delete()
+            log.info("Auto-deleted message %s in channel %s", message.id, message.channel.id)
+        except discord.NotFound:
+            log.info("Message %s already deleted.", message.id)
+        except discord.Forbidden:
+            log.warning("No permission to delete message %s in %s", message.id, message.channel.id)
+        except Exception as exc:  # noqa: BLE001
+            log.exception("Failed to auto-delete message %s: %s", message.id, exc)
+
 
 async def send_followup_autodelete(
     interaction: discord.Interaction,
@@ -132,19 +321,7 @@ async def send_followup_autodelete(
         log.warning("Interaction expired before followup could be sent.")
         return
 
-    async def _delete_later(message: discord.Message) -> None:
-        try:
-            await asyncio.sleep(delay)
-            await message.delete()
-            log.info("Auto-deleted message %s in #%s", message.id, message.channel)
-        except discord.NotFound:
-            log.info("Message %s already deleted.", message.id)
-        except discord.Forbidden:
-            log.warning("No permission to delete message %s in %s", message.id, message.channel)
-        except Exception as exc:  # noqa: BLE001
-            log.exception("Failed to auto-delete message %s: %s", message.id, exc)
-
-    interaction.client.loop.create_task(_delete_later(msg))
+    schedule_autodelete(msg, delay)
 
 
 # ======================================================================
@@ -176,24 +353,28 @@ async def store_current_debug(interaction: discord.Interaction) -> None:
         await interaction.followup.send(embed=embed)
         return
 
-    # Top-level keys
-    top_keys = ", ".join(list(data.keys())[:20]) or "(no keys)"
+    # Top-level keys (islice: no need to materialize the full key list)
+    top_keys = ", ".join(islice(data.keys(), 20)) or "(no keys)"
 
     # Try to locate a list of items; common patterns: 'items', 'store', etc.
-    items = None
-    items_key = None
-    for candidate in ("items", "store", "skins", "entries"):
-        value = data.get(candidate)
-        if isinstance(value, list) and value:
-            items = value
-            items_key = candidate
-            break
+    items_key = next(
+        (
+            k
+            for k in ("items", "store", "skins", "entries")
+            if isinstance(data.get(k), list) and data[k]
+        ),
+        None,
+    )
+    items = data[items_key] if items_key else None
 
     if items is None:
         sample_block = "No obvious item list found (keys only)."
     else:
         first_item = items[0]
-        pretty = json.dumps(first_item, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            pretty = orjson.dumps(first_item, option=orjson.OPT_INDENT_2).decode()
+        else:
+            pretty = json.dumps(first_item, indent=2, ensure_ascii=False)
         if len(pretty) > 900:
             pretty = pretty[:900] + "\n... (truncated)"
         sample_block = f"Key: `{items_key}`\n```json\n{pretty}\n```"
@@ -322,20 +503,20 @@ async def week_lookup(
             description=f"That date is not valid: `{exc}`",
             color=discord.Color.red(),
         )
-        embed.set_footer(text="SCMM • Weekly Store by Date • Auto-deletes in 5 minutes")
+        embed.set_footer(text=embeds.FOOTER_WEEK_BY_DATE)
         await send_followup_autodelete(interaction, embed=embed)
         return
 
     # 2) Fetch that week’s store from SCMM
     try:
-        items, store_id = await scmm_client.fetch_store_items_for_date(target_date)
+        items, store_id = await _cached_store_items_for_date(target_date)
     except RuntimeError as exc:
         embed = discord.Embed(
             title="🛒 Weekly Store – Error",
             description=str(exc),
             color=discord.Color.red(),
         )
-        embed.set_footer(text="SCMM • Weekly Store by Date • Auto-deletes in 5 minutes")
+        embed.set_footer(text=embeds.FOOTER_WEEK_BY_DATE)
         await send_followup_autodelete(interaction, embed=embed)
         return
 
@@ -348,7 +529,7 @@ async def week_lookup(
             ),
             color=discord.Color.orange(),
         )
-        embed.set_footer(text="SCMM • Weekly Store by Date • Auto-deletes in 5 minutes")
+        embed.set_footer(text=embeds.FOOTER_WEEK_BY_DATE)
         await send_followup_autodelete(interaction, embed=embed)
         return
 
@@ -360,18 +541,24 @@ async def week_lookup(
 
     # 3) For each item, pull details and build a card
     #    week_lookup = Store vs Steam ONLY (include_third_party=False)
-    for item in items:
-        details = None
+    #
+    # Detail lookups are independent HTTP GETs, so fetch them
+    # concurrently; the client helper caps in-flight requests and maps
+    # failed lookups to None.
+    details_list = await scmm_client.fetch_item_details_bulk(
+        items, concurrency=MAX_DETAIL_CONCURRENCY
+    )
 
-        try:
-            details = await scmm_client.fetch_item_details_for_store_item(item)
-        except RuntimeError as exc:
-            logger.info(
-                "Failed to enrich item %s for %s: %s",
-                item.name,
-                target_date.isoformat(),
-                exc,
-            )
+    # Discord allows concurrent follow-ups on one interaction token, so we
+    # fire the sends as tasks instead of blocking on each REST POST in turn.
+    send_tasks: list[asyncio.Task[None]] = []
+    date_iso = target_date.isoformat()
+    sid_part = f" • ID {store_id}" if store_id else ""
+    footer_label = embeds.FOOTER_WEEK_STORE.format(date=date_iso, sid=sid_part)
+
+    for item, details in zip(items, details_list):
+        if details is None:
+            logger.info("No details for item %s on %s", item.name, date_iso)
 
         embed = embeds.build_store_item_embed(
             item,
@@ -379,14 +566,11 @@ async def week_lookup(
             include_third_party=False,  # no Skinport / CS.Deals here
         )
 
-        footer_label = (
-            f"SCMM • Store {target_date.isoformat()}"
-            + (f" • ID {store_id}" if store_id else "")
-            + " • Auto-deletes in 5 minutes"
-        )
         embed.set_footer(text=footer_label)
 
-        await send_followup_autodelete(interaction, embed=embed)
+        send_tasks.append(
+            asyncio.create_task(send_followup_autodelete(interaction, embed=embed))
+        )
 
     # If we truncated a huge store, tell the user
     if truncated:
@@ -398,8 +582,12 @@ async def week_lookup(
             ),
             color=discord.Color.orange(),
         )
-        note_embed.set_footer(text="SCMM • Weekly Store by Date • Auto-deletes in 5 minutes")
-        await send_followup_autodelete(interaction, embed=note_embed)
+        note_embed.set_footer(text=embeds.FOOTER_WEEK_BY_DATE)
+        send_tasks.append(
+            asyncio.create_task(send_followup_autodelete(interaction, embed=note_embed))
+        )
+
+    await asyncio.gather(*send_tasks)
 
 
 # ======================================================================
@@ -451,13 +639,15 @@ async def item_lookup(interaction: discord.Interaction, name: str) -> None:
             description=msg,
             color=color,
         )
-        embed.set_footer(text="SCMM • Item Market Overview • Auto-deletes in 5 minutes")
+        embed.set_footer(text=embeds.FOOTER_ITEM_OVERVIEW)
         await send_followup_autodelete(interaction, embed=embed)
         return
 
     # /item_lookup shows full breakdown (Store vs Steam vs Skinport vs CS.Deals)
-    embed = embeds.build_item_overview_embed(details)
-    view = embeds.build_iteminfo_view(details)
+    # One fused pass yields both the price breakdown and the button URLs.
+    breakdown, urls = scmm_client.extract_market_info(details)
+    embed = embeds.build_item_overview_embed(details, breakdown=breakdown)
+    view = embeds.build_iteminfo_view(details, urls=urls)
 
     await send_followup_autodelete(
         interaction,
@@ -471,6 +661,28 @@ async def item_lookup(interaction: discord.Interaction, name: str) -> None:
 # ======================================================================
 
 
+@functools.lru_cache(maxsize=4096)
+def _autocomplete_variants(query: str) -> tuple[app_commands.Choice[str], ...]:
+    """
+    Build the Choice variants for one autocomplete query.
+
+    Cached because Discord fires autocomplete on every keystroke and the
+    same prefixes repeat constantly; Choice objects are never mutated so
+    sharing instances across users/interactions is safe.
+    """
+    variants = {query, query.title(), query.lower()}
+    choices: list[app_commands.Choice[str]] = []
+
+    for value in variants:
+        if not value:
+            continue
+        choices.append(app_commands.Choice(name=value[:100], value=value))
+        if len(choices) >= 5:
+            break
+
+    return tuple(choices)
+
+
 @item_lookup.autocomplete("name")
 async def item_lookup_name_autocomplete(
     interaction: discord.Interaction,  # noqa: ARG001
@@ -486,17 +698,7 @@ async def item_lookup_name_autocomplete(
     if len(query) < 2:
         return []
 
-    variants = {query, query.title(), query.lower()}
-    choices: list[app_commands.Choice[str]] = []
-
-    for value in variants:
-        if not value:
-            continue
-        choices.append(app_commands.Choice(name=value[:100], value=value))
-        if len(choices) >= 5:
-            break
-
-    return choices
+    return list(_autocomplete_variants(query))
 
 
 # ======================================================================
@@ -15,28 +15,150 @@ This module provides:
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import json
 import logging
+import sys
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import date
 from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import quote, quote_plus
+from urllib.parse import quote
 
 import httpx
 
+try:  # optional: ~5x faster JSON decode on big SCMM payloads
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+try:  # optional: lazy JSON parsing for selective-field reads
+    import simdjson
+except ImportError:  # pragma: no cover - depends on environment
+    simdjson = None
+
+#: Container types that may appear inside a parsed item-detail payload.
+#: With pysimdjson installed, `parse_item_bytes` returns lazy Array /
+#: Object proxies instead of lists/dicts, so every consumer that type-
+#: checks a container (market scans here, the stats block in embeds)
+#: accepts both. Public because embeds shares them.
+if simdjson is not None:
+    SEQ_TYPES: tuple = (list, simdjson.Array)
+    MAP_TYPES: tuple = (dict, simdjson.Object)
+else:
+    SEQ_TYPES = (list,)
+    MAP_TYPES = (dict,)
+
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://rust.scmm.app"
 API_BASE = f"{BASE_URL}/api"
 
+#: Shared AsyncClient used for all SCMM requests. Built lazily on first
+#: use with the transport settings in `_get_client` (the bot just warms
+#: it up from `setup_hook` via `warmup`); `set_client` can install a
+#: custom one. One warm pool means each request skips the TCP+TLS
+#: handshake that a per-call client pays.
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared client, constructing it lazily if needed."""
+    global _CLIENT
+    if _CLIENT is None:
+        # HTTP/2 multiplexes all in-flight SCMM requests over one TLS
+        # connection; one transport-level retry shrugs off a keepalive
+        # socket the server closed while idle.
+        _CLIENT = httpx.AsyncClient(
+            timeout=20.0,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=1,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            ),
+        )
+    return _CLIENT
+
+
+async def warmup() -> None:
+    """
+    Open the shared client's first SCMM connection ahead of traffic.
+
+    Resolves DNS and completes the TLS + HTTP/2 handshake once at
+    startup so the first user command doesn't pay for them; with the
+    keepalive pool, later requests ride the already-warm connection.
+    Failures are logged and ignored — the first real request retries.
+    """
+    try:
+        await _get_client().head(f"{BASE_URL}/docs/index.html", timeout=5.0)
+    except Exception:  # noqa: BLE001
+        logger.info("SCMM warm-up request failed; first command will retry.", exc_info=True)
+
+
+def set_client(client: httpx.AsyncClient) -> None:
+    """
+    Install a shared `httpx.AsyncClient` for all SCMM requests.
+
+    Optional override seam: the bot relies on the lazily built default
+    from `_get_client`, but embedders can swap in a differently
+    configured client (proxies, recording transports, ...). Callers own
+    the client's lifetime and should close it via `aclose_client`.
+    """
+    global _CLIENT
+    _CLIENT = client
+
+
+async def aclose_client() -> None:
+    """Close the shared client (installed or lazily built), if any."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+# ======================================================================
+# Price normalization
+# ======================================================================
+
+
+def _nonempty_str(val: Any) -> Optional[str]:
+    """Return `val` if it is a non-empty str, else None."""
+    return val if isinstance(val, str) and val else None
+
+
+def _norm_price(val: Any) -> Optional[float]:
+    """
+    Normalize a raw SCMM price into USD, or None for non-numbers.
+
+    SCMM commonly uses integer cents; the heuristic treats values > 50
+    as cents. `type(...) is` is deliberate — SCMM prices are never bool
+    and the exact-type check is cheaper than isinstance in CPython.
+    """
+    t = type(val)
+    if t is int:
+        return val / 100.0 if val > 50 else float(val)
+    if t is float:
+        return val / 100.0 if val > 50 else val
+    return None
+
 
 # ======================================================================
 # Data models
 # ======================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StoreItem:
-    """Normalized minimal view of a Rust store item from SCMM."""
+    """
+    Normalized minimal view of a Rust store item from SCMM.
+
+    Slotted and frozen: stores carry 100+ items, so dropping the
+    per-instance __dict__ roughly third's the footprint and makes
+    attribute reads go through C-level slot descriptors; frozen also
+    makes items hashable, so they can serve as cache keys.
+    """
 
     id: Optional[int]
     name: str
@@ -68,8 +190,9 @@ async def ping_scmm() -> Tuple[bool, str]:
     url = f"{BASE_URL}/docs/index.html"
 
     try:
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            resp = await client.get(url)
+        # HEAD: connectivity is all we care about, so never transfer the
+        # docs page body; a short timeout keeps health checks snappy.
+        resp = await _get_client().head(url, timeout=5.0)
         resp.raise_for_status()
     except httpx.ReadTimeout as exc:
         logger.warning("SCMM ping timed out: %s", exc, exc_info=True)
@@ -88,23 +211,32 @@ async def ping_scmm() -> Tuple[bool, str]:
         logger.exception("Unexpected error pinging SCMM")
         return False, f"Unexpected error: {type(exc).__name__}: {exc}"
 
-    size = len(resp.content or b"")
-    return True, f"OK — HTTP {resp.status_code}, docs payload size ≈ {size} bytes."
+    # Prefer the Content-Length header: O(1) and no body materialization.
+    size = int(resp.headers.get("content-length") or 0)
+    if size:
+        return True, f"OK — HTTP {resp.status_code}, docs payload size ≈ {size} bytes."
+    return True, f"OK — HTTP {resp.status_code}."
 
 
-async def _http_get_json(url: str) -> Any:
+async def _http_get_bytes(url: str) -> bytes:
     """
-    Perform an HTTP GET request and decode the JSON body.
+    Perform an HTTP GET request and return the raw body bytes.
+
+    Split out from `_http_get_json` so callers that want to pick their
+    own parser (e.g. `parse_item_bytes` on the bulk detail path) reuse
+    the same transport and error handling.
 
     Raises
     ------
     RuntimeError
-        If the request fails or the response is not valid JSON.
+        If the request fails.
     """
     try:
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            resp = await client.get(url)
-        resp.raise_for_status()
+        # stream + aread skips httpx's internal buffering layer, so the
+        # body goes bytes -> parser with one allocation for the tree.
+        async with _get_client().stream("GET", url) as resp:
+            resp.raise_for_status()
+            return await resp.aread()
     except httpx.RequestError as exc:
         logger.warning("Network error calling %s: %s", url, exc, exc_info=True)
         raise RuntimeError(f"Network error talking to SCMM: {exc}") from exc
@@ -120,9 +252,23 @@ async def _http_get_json(url: str) -> Any:
             f"Unexpected error calling SCMM: {type(exc).__name__}: {exc}"
         ) from exc
 
+
+async def _http_get_json(url: str) -> Any:
+    """
+    Perform an HTTP GET request and decode the JSON body.
+
+    Raises
+    ------
+    RuntimeError
+        If the request fails or the response is not valid JSON.
+    """
+    body = await _http_get_bytes(url)
     try:
-        return resp.json()
+        if orjson is not None:
+            return orjson.loads(body)
+        return json.loads(body)
     except ValueError as exc:
+        # orjson.JSONDecodeError subclasses ValueError, same as stdlib.
         logger.warning("Failed to decode JSON from %s: %s", url, exc, exc_info=True)
         raise RuntimeError("SCMM returned invalid JSON") from exc
 
@@ -155,32 +301,29 @@ def _normalize_store_item(raw: Dict[str, Any]) -> StoreItem:
     SCMM commonly uses integer cents for prices; this function normalizes
     them into USD floats where possible.
     """
-    id_ = raw.get("id")
-    name = raw.get("name") or "Unknown"
-
-    # Store price: SCMM commonly uses integer cents.
-    store_price: Optional[float] = None
-    raw_price: Optional[float] = None
-    for key in ("storePrice", "price", "usdPrice", "finalPrice"):
-        val = raw.get(key)
-        if isinstance(val, (int, float)):
-            raw_price = float(val)
-            break
-
-    if raw_price is not None:
-        store_price = raw_price / 100.0 if raw_price > 50 else raw_price
-
-    icon_url = (
-        raw.get("iconUrl")
-        or raw.get("iconURL")
-        or raw.get("imageUrl")
-        or None
-    )
-
-    workshop_file_id = raw.get("workshopFileId")
-    app_id = raw.get("appId")
-    item_type = raw.get("itemType") or None
-    item_collection = raw.get("itemCollection") or None
+    get = raw.get
+
+    id_ = get("id")
+    name = get("name") or "Unknown"
+
+    # Store price: first key that holds a number wins. Unrolled as a
+    # short-circuit chain — on the common path ("storePrice" present)
+    # exactly one lookup runs, with no loop or key-tuple setup. A plain
+    # or-chain would be wrong here: 0 is a legitimate price.
+    store_price = _norm_price(get("storePrice"))
+    if store_price is None:
+        store_price = _norm_price(get("price"))
+        if store_price is None:
+            store_price = _norm_price(get("usdPrice"))
+            if store_price is None:
+                store_price = _norm_price(get("finalPrice"))
+
+    icon_url = get("iconUrl") or get("iconURL") or get("imageUrl") or None
+
+    workshop_file_id = get("workshopFileId")
+    app_id = get("appId")
+    item_type = get("itemType") or None
+    item_collection = get("itemCollection") or None
 
     return StoreItem(
         id=id_,
@@ -203,32 +346,42 @@ async def fetch_store_current_items() -> List[StoreItem]:
     if not isinstance(raw_items, list):
         return []
 
-    items: List[StoreItem] = []
-    for raw in raw_items:
-        if isinstance(raw, dict):
-            items.append(_normalize_store_item(raw))
-    return items
+    # Local binding: skips the module-global lookup per element.
+    _norm = _normalize_store_item
+    return [_norm(raw) for raw in raw_items if type(raw) is dict]
 
 
 async def fetch_store_list_raw() -> List[Dict[str, Any]]:
     """
     List all known store instances from `/api/store`.
 
+    The store list only changes on weekly rotations, so responses are
+    cached for a short TTL; repeat calls within it skip the round-trip.
+
     Returns
     -------
     list[dict]
         Raw store entries as returned by SCMM.
     """
+    global _store_list_cache
+    cached = _store_list_cache
+    if cached is not None and time.monotonic() - cached[0] < _STORE_LIST_TTL:
+        return cached[1]
+
     url = f"{API_BASE}/store"
     data = await _http_get_json(url)
 
+    stores: List[Dict[str, Any]] = []
     if isinstance(data, list):
-        return data
-    if isinstance(data, dict):
+        stores = data
+    elif isinstance(data, dict):
         items = data.get("items")
         if isinstance(items, list):
-            return items
-    return []
+            stores = items
+
+    if stores:
+        _store_list_cache = (time.monotonic(), stores)
+    return stores
 
 
 async def fetch_store_items_by_id(store_id: str) -> List[StoreItem]:
@@ -254,11 +407,8 @@ async def fetch_store_items_by_id(store_id: str) -> List[StoreItem]:
     if not isinstance(raw_items, list):
         return []
 
-    return [
-        _normalize_store_item(raw)
-        for raw in raw_items
-        if isinstance(raw, dict)
-    ]
+    _norm = _normalize_store_item
+    return [_norm(raw) for raw in raw_items if type(raw) is dict]
 
 
 async def fetch_store_items_for_date(
@@ -287,20 +437,21 @@ async def fetch_store_items_for_date(
 
     target_str = target_date.isoformat()  # 'YYYY-MM-DD'
 
-    matches: List[Dict[str, Any]] = []
+    # Single pass: filter on the date prefix and keep the latest start
+    # time on that day, instead of building a match list and sorting it.
+    chosen: Optional[Dict[str, Any]] = None
+    chosen_key = ""
     for store in stores:
         start = store.get("start")
-        if not isinstance(start, str):
+        if not isinstance(start, str) or not start.startswith(target_str):
             continue
-        start_date_str = start.split("T", 1)[0]
-        if start_date_str == target_str:
-            matches.append(store)
+        if start > chosen_key:
+            chosen_key = start
+            chosen = store
 
-    if not matches:
+    if chosen is None:
         return [], None
 
-    # Choose the latest start time on that day
-    chosen = sorted(matches, key=lambda s: str(s.get("start") or ""))[-1]
     store_id = chosen.get("id")
     if not store_id:
         return [], None
@@ -313,25 +464,143 @@ async def fetch_store_items_for_date(
 # Per-item detail + market breakdown
 # ======================================================================
 
+#: Bytes that survive percent-encoding untouched (RFC 3986 unreserved).
+_URL_SAFE_BYTES = frozenset(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_.~"
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _fast_quote(name: str) -> str:
+    """
+    Percent-encode an item name for `/api/item/{name}` URLs.
 
-async def fetch_item_details_for_store_item(item: StoreItem) -> Dict[str, Any]:
+    Names made entirely of unreserved bytes (common for Rust skins) are
+    returned as-is, skipping urllib's per-character loop; anything with
+    spaces or non-ASCII falls through to `quote` unchanged. Memoized
+    because bulk fetches re-quote the same names across commands.
+    """
+    encoded = name.encode("utf-8")
+    if all(c in _URL_SAFE_BYTES for c in encoded):
+        return name
+    return quote(name, safe="")
+
+
+#: Item detail responses keyed on the percent-encoded name, as
+#: (monotonic timestamp, details). Items barely change within a store
+#: rotation, so a cache hit replaces the dominant cost of any repeat
+#: lookup — the SCMM round-trip — with a dict probe.
+_ITEM_CACHE: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_ITEM_CACHE_TTL = 3600.0
+_ITEM_CACHE_MAX = 4096
+
+#: Store list cache: one entry, shorter TTL (rotations are weekly but a
+#: fresh store should show up promptly).
+_store_list_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+_STORE_LIST_TTL = 900.0
+
+
+def _item_cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """Return fresh cached details for `key`, or None on miss/expiry."""
+    hit = _ITEM_CACHE.get(key)
+    if hit is None:
+        return None
+    ts, details = hit
+    if time.monotonic() - ts >= _ITEM_CACHE_TTL:
+        del _ITEM_CACHE[key]
+        return None
+    _ITEM_CACHE.move_to_end(key)
+    return details
+
+
+def _item_cache_put(key: str, details: Dict[str, Any]) -> None:
+    """Cache `details` under `key`, evicting least-recently-used entries."""
+    _ITEM_CACHE[key] = (time.monotonic(), details)
+    _ITEM_CACHE.move_to_end(key)
+    while len(_ITEM_CACHE) > _ITEM_CACHE_MAX:
+        _ITEM_CACHE.popitem(last=False)
+
+
+async def fetch_item_details_for_store_item(item: StoreItem) -> Any:
     """
     Fetch full detail JSON for a store item using `/api/item/{name}`.
 
     This powers all the “insider data”:
     supply, subscribers, votes, favourites, views, breakdown, markets, etc.
+
+    The payload goes through `parse_item_bytes`, so with pysimdjson
+    installed the return value is a lazy mapping proxy rather than a
+    dict: the weekly path reads a handful of fields out of each large
+    blob exactly once, and lazy parsing skips materializing the rest.
+    Consumers must stick to mapping-style reads (`.get` / indexing).
     """
     if not item.name:
         raise RuntimeError("Item has no name for detail lookup")
 
-    safe = quote(item.name, safe="")
+    safe = _fast_quote(item.name)
     url = f"{API_BASE}/item/{safe}"
-    details = await _http_get_json(url)
-    if not isinstance(details, dict):
+    body = await _http_get_bytes(url)
+    try:
+        details = parse_item_bytes(body)
+    except ValueError as exc:
+        logger.warning("Failed to decode JSON from %s: %s", url, exc, exc_info=True)
+        raise RuntimeError("SCMM returned invalid JSON") from exc
+    if not isinstance(details, MAP_TYPES):
         raise RuntimeError("SCMM item details response was not an object")
     return details
 
 
+def parse_item_bytes(raw: bytes) -> Any:
+    """
+    Parse raw item-detail JSON, lazily when pysimdjson is available.
+
+    The returned simdjson document only materializes the fields that are
+    actually indexed, which suits `get_market_breakdown` /
+    `extract_market_urls` reading a handful of keys out of a large blob.
+    A fresh parser is used per call on purpose: parser document buffers
+    are invalidated on reparse, which is unsafe once fetches overlap.
+
+    Falls back to a fully materialized dict without pysimdjson.
+    """
+    if simdjson is not None:
+        return simdjson.Parser().parse(raw)
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+async def fetch_item_details_bulk(
+    items: List[StoreItem],
+    concurrency: int = 16,
+) -> List[Optional[Any]]:
+    """
+    Fetch detail JSON for many store items concurrently.
+
+    Issues the per-item GETs through `asyncio.gather`, bounded by a
+    semaphore so at most `concurrency` requests are in flight against
+    SCMM at once. Items whose lookup fails yield None (with the failure
+    logged) so one bad item never sinks the whole batch.
+
+    Returns
+    -------
+    list
+        Detail payloads (mapping-like, lazily parsed where pysimdjson
+        is available) in the same order as `items`, with None for
+        failed lookups.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(item: StoreItem) -> Optional[Any]:
+        async with sem:
+            try:
+                return await fetch_item_details_for_store_item(item)
+            except RuntimeError as exc:
+                logger.info("Failed to fetch details for %s: %s", item.name, exc)
+                return None
+
+    return await asyncio.gather(*(one(item) for item in items))
+
+
 def extract_store_price_from_details(details: Dict[str, Any]) -> Optional[float]:
     """
     Extract the store price (USD) from item details, normalized.
@@ -339,11 +608,7 @@ def extract_store_price_from_details(details: Dict[str, Any]) -> Optional[float]
     SCMM may store the price as integer cents; this function normalizes it
     to a float in USD where possible.
     """
-    val = details.get("storePrice")
-    if not isinstance(val, (int, float)):
-        return None
-    v = float(val)
-    return v / 100.0 if v > 50 else v
+    return _norm_price(details.get("storePrice"))
 
 
 async def fetch_item_details_by_name(name: str) -> Dict[str, Any]:
@@ -362,7 +627,12 @@ async def fetch_item_details_by_name(name: str) -> Dict[str, Any]:
     if not clean:
         raise RuntimeError("Item name is required")
 
-    safe = quote(clean, safe="")
+    safe = _fast_quote(clean)
+
+    cached = _item_cache_get(safe)
+    if cached is not None:
+        return cached
+
     url = f"{API_BASE}/item/{safe}"
 
     try:
@@ -381,64 +651,103 @@ async def fetch_item_details_by_name(name: str) -> Dict[str, Any]:
     if not isinstance(details, dict):
         raise RuntimeError("SCMM item details response was not an object")
 
+    # Only successful lookups are cached; errors always retry SCMM.
+    _item_cache_put(safe, details)
     return details
 
 
-def get_market_breakdown(details: Dict[str, Any]) -> Dict[str, Optional[float]]:
+#: Fallback marketplace URL templates, bound to str.format once at
+#: import so the per-item fallback path does no constant re-concatenation.
+#: Steam listing is for Rust (appId 252490).
+_STEAM_LISTING_FMT = "https://steamcommunity.com/market/listings/252490/{}".format
+_SKINPORT_SEARCH_FMT = "https://skinport.com/rust?search={}".format
+_CSDEALS_SEARCH_FMT = (
+    "https://cs.deals/new/market?game=rust&sort=newest&sort_desc=1&exact_match=0&name={}"
+).format
+
+#: marketType -> slot index into the per-market minimum-price list used
+#: by `get_market_breakdown` (0=Steam, 1=Skinport, 2=CS.Deals). Keys are
+#: interned so lookups with interned strings hit the identity fast path
+#: before falling back to a full string compare.
+_MKT_SLOT: Dict[str, int] = {
+    sys.intern("SteamCommunityMarket"): 0,
+    sys.intern("SteamMarket"): 0,
+    sys.intern("Skinport"): 1,
+    sys.intern("CSDealsMarketplace"): 2,
+}
+
+
+def extract_market_info(
+    details: Dict[str, Any],
+) -> Tuple[Dict[str, Optional[float]], Dict[str, Optional[str]]]:
     """
-    Build a unified pricing model for one skin.
+    One-pass extraction of the market breakdown and marketplace URLs.
 
-    Returns a dict with:
-      - store_price (USD)
-      - steam_price (USD)
-      - steam_vs_store_pct     (Steam vs store, +x% or -x%)
-      - skinport_price (USD)
-      - skinport_vs_steam_pct  (Skinport vs Steam)
-      - csdeals_price (USD)
-      - csdeals_vs_steam_pct   (CS.Deals vs Steam)
-    """
+    `get_market_breakdown` and `extract_market_urls` used to walk
+    buyPrices/sellPrices independently; this fuses both scans so each
+    entry is filtered and dispatched once. Callers that need prices and
+    URLs together (the /item_lookup path) should use this directly.
 
-    def _norm_price(val: Any) -> Optional[float]:
-        if not isinstance(val, (int, float)):
-            return None
-        v = float(val)
-        # Heuristic: values > 50 are probably cents
-        return v / 100.0 if v > 50 else v
+    Returns
+    -------
+    (breakdown, urls)
+        breakdown:
+            Same shape as `get_market_breakdown`.
+        urls:
+            Same shape as `extract_market_urls`.
+    """
 
     store_price = extract_store_price_from_details(details)
 
-    steam_price: Optional[float] = None
-    skinport_price: Optional[float] = None
-    csdeals_price: Optional[float] = None
+    # Minimum seen price per market slot (see _MKT_SLOT); a dict dispatch
+    # replaces the old three-way string-compare chain per entry.
+    mins: List[Optional[float]] = [None, None, None]
+    slot_of = _MKT_SLOT.get
 
-    def scan(seq: List[Dict[str, Any]]) -> None:
-        nonlocal steam_price, skinport_price, csdeals_price
+    urls: Dict[str, Optional[str]] = {
+        "steam": None,
+        "skinport": None,
+        "csdeals": None,
+    }
+
+    for key in ("buyPrices", "sellPrices"):
+        seq = details.get(key)
+        if not isinstance(seq, SEQ_TYPES):
+            continue
 
         for entry in seq:
-            if not isinstance(entry, dict):
+            if not isinstance(entry, MAP_TYPES):
                 continue
+
+            slot = slot_of(entry.get("marketType"))
+            if slot is None:
+                continue
+
+            # URLs: first one seen wins, Steam/Skinport only. CS.Deals
+            # URLs from SCMM are ignored on purpose – we want our own
+            # pattern. Unlike prices, URL collection does not filter on
+            # isAvailable: a delisted entry's URL is still a valid link.
+            if slot == 0 and urls["steam"] is None:
+                url = entry.get("url") or entry.get("link") or entry.get("href")
+                if isinstance(url, str) and url:
+                    urls["steam"] = url
+            elif slot == 1 and urls["skinport"] is None:
+                url = entry.get("url") or entry.get("link") or entry.get("href")
+                if isinstance(url, str) and url:
+                    urls["skinport"] = url
+
             if entry.get("isAvailable") is False:
                 continue
 
-            mtype = entry.get("marketType")
             p = _norm_price(entry.get("price"))
             if p is None:
                 continue
 
-            if mtype in ("SteamCommunityMarket", "SteamMarket"):
-                if steam_price is None or p < steam_price:
-                    steam_price = p
-            elif mtype == "Skinport":
-                if skinport_price is None or p < skinport_price:
-                    skinport_price = p
-            elif mtype == "CSDealsMarketplace":
-                if csdeals_price is None or p < csdeals_price:
-                    csdeals_price = p
+            cur = mins[slot]
+            if cur is None or p < cur:
+                mins[slot] = p
 
-    for key in ("buyPrices", "sellPrices"):
-        seq = details.get(key)
-        if isinstance(seq, list):
-            scan(seq)
+    steam_price, skinport_price, csdeals_price = mins
 
     # %: Steam vs Store
     steam_vs_store_pct: Optional[float] = None
@@ -451,19 +760,69 @@ def get_market_breakdown(details: Dict[str, Any]) -> Dict[str, Optional[float]]:
             return None
         return (price - steam_price) / steam_price * 100.0
 
-    skinport_vs_steam_pct = _pct_vs_steam(skinport_price)
-    csdeals_vs_steam_pct = _pct_vs_steam(csdeals_price)
-
-    return {
+    breakdown: Dict[str, Optional[float]] = {
         "store_price": store_price,
         "steam_price": steam_price,
         "steam_vs_store_pct": steam_vs_store_pct,
         "skinport_price": skinport_price,
-        "skinport_vs_steam_pct": skinport_vs_steam_pct,
+        "skinport_vs_steam_pct": _pct_vs_steam(skinport_price),
         "csdeals_price": csdeals_price,
-        "csdeals_vs_steam_pct": csdeals_vs_steam_pct,
+        "csdeals_vs_steam_pct": _pct_vs_steam(csdeals_price),
     }
 
+    # Top-level fallback keys for Steam + Skinport only; csdeals is
+    # intentionally excluded. Straight or-chains instead of a key loop:
+    # they short-circuit without per-market list/dict setup.
+    get = details.get
+    urls["steam"] = (
+        urls["steam"]
+        or _nonempty_str(get("steamMarketUrl"))
+        or _nonempty_str(get("steamMarketURL"))
+        or _nonempty_str(get("steamUrl"))
+    )
+    urls["skinport"] = (
+        urls["skinport"]
+        or _nonempty_str(get("skinportUrl"))
+        or _nonempty_str(get("skinPortUrl"))
+    )
+
+    # Final fallback: construct URLs from the item name. One quote()
+    # pass covers all three: quote_plus output only differs in spaces,
+    # so the CS.Deals query derives from the already-encoded name.
+    name = details.get("name")
+    if isinstance(name, str) and name:
+        safe_name = quote(name, safe="")
+
+        if urls["steam"] is None:
+            urls["steam"] = _STEAM_LISTING_FMT(safe_name)
+
+        if urls["skinport"] is None:
+            urls["skinport"] = _SKINPORT_SEARCH_FMT(safe_name)
+
+        # CS.Deals: ALWAYS our custom Rust-market search URL
+        urls["csdeals"] = _CSDEALS_SEARCH_FMT(safe_name.replace("%20", "+"))
+
+    return breakdown, urls
+
+
+def get_market_breakdown(details: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """
+    Build a unified pricing model for one skin.
+
+    Returns a dict with:
+      - store_price (USD)
+      - steam_price (USD)
+      - steam_vs_store_pct     (Steam vs store, +x% or -x%)
+      - skinport_price (USD)
+      - skinport_vs_steam_pct  (Skinport vs Steam)
+      - csdeals_price (USD)
+      - csdeals_vs_steam_pct   (CS.Deals vs Steam)
+
+    Thin wrapper over `extract_market_info`; prefer that when the URLs
+    are needed as well.
+    """
+    return extract_market_info(details)[0]
+
 
 # ======================================================================
 # Marketplace URLs
@@ -489,80 +848,11 @@ def extract_market_urls(details: Dict[str, Any]) -> Dict[str, Optional[str]]:
             &sort_desc=1
             &exact_match=0
             &name=...
-    """
-    urls: Dict[str, Optional[str]] = {
-        "steam": None,
-        "skinport": None,
-        "csdeals": None,
-    }
-
-    # 1) Scan price entries for URLs for Steam/Skinport ONLY
-    for key in ("buyPrices", "sellPrices"):
-        seq = details.get(key)
-        if not isinstance(seq, list):
-            continue
-
-        for entry in seq:
-            if not isinstance(entry, dict):
-                continue
 
-            mtype = entry.get("marketType")
-            url = entry.get("url") or entry.get("link") or entry.get("href")
-            if not isinstance(url, str) or not url:
-                continue
-
-            # Steam / SteamCommunityMarket
-            if mtype in ("SteamCommunityMarket", "SteamMarket"):
-                if urls["steam"] is None:
-                    urls["steam"] = url
-
-            # Skinport
-            elif mtype == "Skinport":
-                if urls["skinport"] is None:
-                    urls["skinport"] = url
-
-            # CS.Deals URLs from SCMM are ignored on purpose –
-            # we want our own pattern.
-            # elif mtype == "CSDealsMarketplace":
-            #     pass
-
-    # 2) Top-level fallback keys for Steam + Skinport only
-    top_map: Dict[str, List[str]] = {
-        "steam": ["steamMarketUrl", "steamMarketURL", "steamUrl"],
-        "skinport": ["skinportUrl", "skinPortUrl"],
-        # csdeals is intentionally excluded here
-    }
-
-    for market_key, candidates in top_map.items():
-        if urls[market_key] is not None:
-            continue
-        for field in candidates:
-            val = details.get(field)
-            if isinstance(val, str) and val:
-                urls[market_key] = val
-                break
-
-    # 3) Final fallback: construct URLs from the item name
-    name = details.get("name")
-    if isinstance(name, str) and name:
-        safe_name = quote(name, safe="")
-
-        # Steam listing for Rust (appId 252490)
-        if urls["steam"] is None:
-            urls["steam"] = f"https://steamcommunity.com/market/listings/252490/{safe_name}"
-
-        # Skinport Rust search
-        if urls["skinport"] is None:
-            urls["skinport"] = f"https://skinport.com/rust?search={safe_name}"
-
-        # CS.Deals: ALWAYS our custom Rust-market search URL
-        name_for_query = quote_plus(name)
-        urls["csdeals"] = (
-            "https://cs.deals/new/market"
-            f"?game=rust&sort=newest&sort_desc=1&exact_match=0&name={name_for_query}"
-        )
-
-    return urls
+    Thin wrapper over `extract_market_info`; prefer that when the price
+    breakdown is needed as well.
+    """
+    return extract_market_info(details)[1]
 
 
 # ======================================================================
@@ -589,6 +879,9 @@ def calculate_tradable_datetime(released_at: str) -> str:
 
 __all__ = [
     "StoreItem",
+    "set_client",
+    "aclose_client",
+    "warmup",
     "ping_scmm",
     "fetch_store_current_raw",
     "fetch_store_current_items",
@@ -596,8 +889,13 @@ __all__ = [
     "fetch_store_items_by_id",
     "fetch_store_items_for_date",
     "fetch_item_details_for_store_item",
+    "fetch_item_details_bulk",
     "extract_store_price_from_details",
+    "parse_item_bytes",
+    "SEQ_TYPES",
+    "MAP_TYPES",
     "fetch_item_details_by_name",
+    "extract_market_info",
     "get_market_breakdown",
     "extract_market_urls",
     "calculate_tradable_datetime",